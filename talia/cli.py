@@ -1,13 +1,10 @@
 """Main CLI module for Talia CLI."""
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List
-import os
-import shutil
 import logging
 
 from .models import Task, TaskStatus
@@ -15,18 +12,38 @@ from .storage import STORAGE_FILE, backup_tasks, remove_storage_file
 from .logger import logger
 from .repo import TaskRepo
 
-console = Console()
+# rich is imported lazily inside the rendering paths; importing it at module
+# level costs tens of milliseconds on every invocation, including --help.
+
+# Status choice tables, computed once instead of per decoration/lookup.
+_STATUS_NAMES = tuple(s.name for s in TaskStatus)
+_STATUS_BY_NAME = {s.name: s for s in TaskStatus}
+
+# Fully-styled status cell per status, computed once instead of per row.
+_STATUS_CELL = {
+    s: f"[green]{s.value}[/green]" if s is TaskStatus.COMPLETED
+    else f"[yellow]{s.value}[/yellow]"
+    for s in TaskStatus
+}
 
-def create_task_table(tasks_to_show: List[Task], title: Optional[str] = None) -> Table:
+@lru_cache(maxsize=None)
+def _get_console():
+    """Create the shared rich Console on first use."""
+    from rich.console import Console
+    return Console()
+
+def create_task_table(tasks_to_show: List[Task], title: Optional[str] = None) -> "Table":
     """Create a table to display tasks.
-    
+
     Args:
         tasks_to_show: List of tasks to display
         title: Optional title for the table
-    
+
     Returns:
         A rich Table object with the tasks
     """
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold", title=title)
     table.add_column("ID", style="cyan", width=4)
     table.add_column("Title", style="green")
@@ -34,16 +51,28 @@ def create_task_table(tasks_to_show: List[Task], title: Optional[str] = None) ->
     table.add_column("Created", style="blue", width=16)
     
     for task in tasks_to_show:
-        status_style = "green" if task.status == TaskStatus.COMPLETED else "yellow"
         table.add_row(
             str(task.id),
             task.title,
-            f"[{status_style}]{task.status.value}[/{status_style}]",
+            _STATUS_CELL[task.status],
             task.created_at.strftime("%Y-%m-%d %H:%M")
         )
     
     return table
 
+def _flush_repo(repo: TaskRepo):
+    """Flush queued operations when the invocation ends.
+
+    Runs after the command body has returned, outside every command's own
+    try/except, so failures are reported here instead of surfacing as a
+    raw traceback.
+    """
+    try:
+        repo.flush()
+    except Exception as e:
+        logger.error(f"Failed to save tasks: {e}")
+        _get_console().print("❌ Failed to save tasks", style="red")
+
 @click.group()
 @click.option('-v', '--verbose', is_flag=True, help='Enable verbose (debug) output')
 @click.pass_context
@@ -55,6 +84,9 @@ def cli(ctx, verbose):
         logger.setLevel(logging.WARNING)
     if not ctx.obj:
         ctx.obj = TaskRepo(STORAGE_FILE)
+    # Write all queued operations in one batch when the invocation ends.
+    repo = ctx.obj
+    ctx.call_on_close(lambda: _flush_repo(repo))
 
 @cli.command()
 @click.argument('title')
@@ -69,41 +101,64 @@ def add(repo: TaskRepo, title: str):
             created_at=datetime.now()
         )
         repo.add(task)
-        repo.save()
         logger.info(f"Added new task to inbox: {title}")
-        console.print(f"✅ Added to inbox: {title}", style="green")
+        _get_console().print(f"✅ Added to inbox: {title}", style="green")
     except ValueError as e:
         logger.error(f"Invalid task data: {e}")
-        console.print(f"❌ Failed to add task: {e}", style="red")
+        _get_console().print(f"❌ Failed to add task: {e}", style="red")
     except Exception as e:
         logger.error(f"Failed to add task: {e}")
-        console.print("❌ Failed to add task", style="red")
+        _get_console().print("❌ Failed to add task", style="red")
 
-@cli.command()
-@click.argument('status', required=False, type=click.Choice([s.name for s in TaskStatus], case_sensitive=False))
+@cli.command(name="add-batch")
+@click.argument('source', type=click.File('r'), default='-')
+@click.pass_obj
+def add_batch(repo: TaskRepo, source):
+    """Add one task per line read from SOURCE (a file, or stdin by default)."""
+    try:
+        count = 0
+        for line in source:
+            title = line.strip()
+            if not title:
+                continue
+            repo.add(Task(
+                id=repo.get_next_id(),
+                title=title,
+                status=TaskStatus.INBOX,
+                created_at=datetime.now()
+            ))
+            count += 1
+        logger.info(f"Added {count} tasks to inbox")
+        _get_console().print(f"✅ Added {count} tasks to inbox", style="green")
+    except Exception as e:
+        logger.error(f"Failed to add tasks: {e}")
+        _get_console().print("❌ Failed to add tasks", style="red")
+
+@cli.command(name="list")
+@click.option('--status', type=click.Choice(_STATUS_NAMES, case_sensitive=False))
 @click.pass_obj
-def list(repo: TaskRepo, status: Optional[str]):
-    """List all tasks, optionally filtered by status. Example: talia list inbox"""
+def list_tasks(repo: TaskRepo, status: Optional[str]):
+    """List all tasks, optionally filtered by status. Example: talia list --status inbox"""
     status_msg = f" with status {status}" if status else ""
     filtered_tasks = repo.all
     if status:
-        filtered_tasks = [t for t in repo.all if t.status.name.upper() == status.upper()]
+        filtered_tasks = list(repo.iter_by_status(_STATUS_BY_NAME[status.upper()]))
     
     if not filtered_tasks:
         logger.info(f"No tasks found{status_msg}")
-        console.print(f"📝 No tasks found{status_msg}", style="yellow")
+        _get_console().print(f"📝 No tasks found{status_msg}", style="yellow")
         return
 
     try:
-        # Sort tasks by ID
-        sorted_tasks = sorted(filtered_tasks, key=lambda x: x.id)
-        table = create_task_table(sorted_tasks, title=f"Tasks{status_msg}")
+        # Tasks are already in id order: ids are issued monotonically by
+        # get_next_id and iter_by_status yields in id order.
+        table = create_task_table(filtered_tasks, title=f"Tasks{status_msg}")
         
         logger.debug(f"Displaying {len(filtered_tasks)} tasks")
-        console.print(table)
+        _get_console().print(table)
     except Exception as e:
         logger.error(f"Failed to display tasks: {e}")
-        console.print("❌ Failed to display tasks", style="red")
+        _get_console().print("❌ Failed to display tasks", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -114,24 +169,23 @@ def done(repo: TaskRepo, task_id: int):
         task = repo.get(task_id)
         if not task:
             logger.warning(f"Task {task_id} not found")
-            console.print(f"❌ Task {task_id} not found", style="red")
+            _get_console().print(f"❌ Task {task_id} not found", style="red")
             return
         
         if task.status == TaskStatus.COMPLETED:
             logger.info(f"Task {task_id} is already completed")
-            console.print(f"ℹ️ Task {task_id} is already completed", style="yellow")
+            _get_console().print(f"ℹ️ Task {task_id} is already completed", style="yellow")
             return
         
-        task.complete()
-        repo.save()
+        repo.complete(task)
         logger.info(f"Completed task: {task.title}")
-        console.print(f"✅ Completed task: {task.title}", style="green")
+        _get_console().print(f"✅ Completed task: {task.title}", style="green")
     except ValueError as e:
         logger.error(f"Invalid task data: {e}")
-        console.print(f"❌ Failed to complete task: {e}", style="red")
+        _get_console().print(f"❌ Failed to complete task: {e}", style="red")
     except Exception as e:
         logger.error(f"Failed to complete task: {e}")
-        console.print("❌ Failed to complete task", style="red")
+        _get_console().print("❌ Failed to complete task", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -142,21 +196,20 @@ def archive(repo: TaskRepo, task_id: int):
         task = repo.get(task_id)
         if not task:
             logger.warning(f"Task {task_id} not found")
-            console.print(f"❌ Task {task_id} not found", style="red")
+            _get_console().print(f"❌ Task {task_id} not found", style="red")
             return
         
         if task.status == TaskStatus.ARCHIVED:
             logger.info(f"Task {task_id} is already archived")
-            console.print(f"ℹ️ Task {task_id} is already archived", style="yellow")
+            _get_console().print(f"ℹ️ Task {task_id} is already archived", style="yellow")
             return
         
-        task.archive()
-        repo.save()
+        repo.archive(task)
         logger.info(f"Archived task: {task.title}")
-        console.print(f"📦 Archived task: {task.title}", style="green")
+        _get_console().print(f"📦 Archived task: {task.title}", style="green")
     except Exception as e:
         logger.error(f"Failed to archive task: {e}")
-        console.print("❌ Failed to archive task", style="red")
+        _get_console().print("❌ Failed to archive task", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -167,16 +220,15 @@ def todo(repo: TaskRepo, task_id: int):
         task = repo.get(task_id)
         if not task:
             logger.warning(f"Task {task_id} not found")
-            console.print(f"❌ Task {task_id} not found", style="red")
+            _get_console().print(f"❌ Task {task_id} not found", style="red")
             return
         
-        task.move_to_todo()
-        repo.save()
+        repo.move_to_todo(task)
         logger.info(f"Moved task to To Do: {task.title}")
-        console.print(f"📋 Moved to To Do: {task.title}", style="green")
+        _get_console().print(f"📋 Moved to To Do: {task.title}", style="green")
     except Exception as e:
         logger.error(f"Failed to move task: {e}")
-        console.print("❌ Failed to move task", style="red")
+        _get_console().print("❌ Failed to move task", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -187,16 +239,15 @@ def review(repo: TaskRepo, task_id: int):
         task = repo.get(task_id)
         if not task:
             logger.warning(f"Task {task_id} not found")
-            console.print(f"❌ Task {task_id} not found", style="red")
+            _get_console().print(f"❌ Task {task_id} not found", style="red")
             return
         
-        task.move_to_review()
-        repo.save()
+        repo.move_to_review(task)
         logger.info(f"Moved task to Review: {task.title}")
-        console.print(f"👀 Moved to Review: {task.title}", style="green")
+        _get_console().print(f"👀 Moved to Review: {task.title}", style="green")
     except Exception as e:
         logger.error(f"Failed to move task: {e}")
-        console.print("❌ Failed to move task", style="red")
+        _get_console().print("❌ Failed to move task", style="red")
 
 @cli.command()
 @click.pass_obj
@@ -204,13 +255,16 @@ def dashboard(repo: TaskRepo):
     """Show your task dashboard."""
     if not repo.all:
         logger.info("No tasks found for dashboard")
-        console.print("📝 No tasks found", style="yellow")
+        _get_console().print("📝 No tasks found", style="yellow")
         return
 
     try:
+        from rich.table import Table
+
         # Task Statistics
-        total_tasks = len(repo.all)
-        completed_tasks = len([t for t in repo.all if t.status == TaskStatus.COMPLETED])
+        status_counts = repo.status_counts
+        total_tasks = sum(status_counts.values())
+        completed_tasks = status_counts[TaskStatus.COMPLETED]
         pending_tasks = total_tasks - completed_tasks
         
         # Create statistics panel
@@ -219,27 +273,26 @@ def dashboard(repo: TaskRepo):
         stats.add_row("✅ Completed:", str(completed_tasks))
         stats.add_row("⏳ Pending:", str(pending_tasks))
         
-        console.print("\n📊 Task Dashboard\n", style="bold")
-        console.print(stats)
+        _get_console().print("\n📊 Task Dashboard\n", style="bold")
+        _get_console().print(stats)
         
         # Show recent tasks
         if repo.all:
-            console.print("\n📋 Recent Tasks", style="bold")
-            # Sort tasks by creation date, most recent first
-            sorted_tasks = sorted(repo.all, key=lambda x: x.created_at, reverse=True)
-            # Show last 5 tasks or all if less than 5
-            table = create_task_table(sorted_tasks[:5])
-            console.print(table)
+            _get_console().print("\n📋 Recent Tasks", style="bold")
+            # The repo keeps a bounded deque of the newest tasks, so this
+            # never touches the full list.
+            table = create_task_table(repo.recent())
+            _get_console().print(table)
             
             # Show completion rate if there are tasks
             if total_tasks > 0:
                 completion_rate = (completed_tasks / total_tasks) * 100
-                console.print(f"\n📈 Completion Rate: {completion_rate:.1f}%", style="bold")
+                _get_console().print(f"\n📈 Completion Rate: {completion_rate:.1f}%", style="bold")
         
         logger.debug(f"Displayed dashboard with {total_tasks} tasks ({completed_tasks} completed)")
     except Exception as e:
         logger.error(f"Failed to display dashboard: {e}")
-        console.print("❌ Failed to display dashboard", style="red")
+        _get_console().print("❌ Failed to display dashboard", style="red")
 
 @cli.command()
 @click.option('--name', '-n', help='Custom name for the backup file')
@@ -247,38 +300,54 @@ def dashboard(repo: TaskRepo):
 def backup(repo: TaskRepo, name: Optional[str]):
     """Create a backup of your tasks."""
     try:
-        if os.path.exists(STORAGE_FILE):
-            backup_file = backup_tasks(name)
+        if repo.all:
+            # Fold any journaled operations into the snapshot first so the
+            # backup captures the full task state.
+            repo.save()
+        # Gate on the file, not the parsed tasks: an unreadable file loads
+        # as no tasks but its raw bytes are still worth backing up.
+        if os.path.exists(repo._path):
+            backup_file = backup_tasks(name, repo._path)
             if backup_file:
                 logger.info(f"Created backup: {backup_file}")
-                console.print(f"📦 Tasks backed up to: {backup_file}", style="green")
+                _get_console().print(f"📦 Tasks backed up to: {backup_file}", style="green")
         else:
             logger.warning("No tasks found to backup")
-            console.print("ℹ️  No tasks found to backup", style="yellow")
+            _get_console().print("ℹ️  No tasks found to backup", style="yellow")
     except Exception as e:
         logger.error(f"Failed to create backup: {e}")
-        console.print("❌ Failed to create backup", style="red")
+        _get_console().print("❌ Failed to create backup", style="red")
 
 @cli.command()
 @click.pass_obj
 def reset(repo: TaskRepo):
     """Move current tasks to a backup file and start fresh."""
     try:
+        if repo.all:
+            # Fold any journaled operations into the snapshot first so the
+            # backup captures the full task state.
+            repo.save()
+        # Gate on the file, not the parsed tasks: an unreadable file loads
+        # as no tasks but must still be backed up before being replaced.
         if os.path.exists(repo._path):
             backup_file = backup_tasks("todelete", repo._path)
-            if backup_file and remove_storage_file(repo._path):
+            if not backup_file:
+                logger.error("Backup failed, leaving tasks untouched")
+                _get_console().print("❌ Failed to reset tasks", style="red")
+                return
+            if remove_storage_file(repo._path):
                 logger.info(f"Reset completed, backup at: {backup_file}")
-                console.print(f"📦 Tasks backed up to: {backup_file}", style="green")
+                _get_console().print(f"📦 Tasks backed up to: {backup_file}", style="green")
         else:
             logger.warning("No tasks found to reset")
-            console.print("ℹ️  No tasks found to backup", style="yellow")
-        
+            _get_console().print("ℹ️  No tasks found to backup", style="yellow")
+
         # Clear the in-memory tasks
-        repo._tasks = []
+        repo.clear()
         repo.save()
     except Exception as e:
         logger.error(f"Failed to reset tasks: {e}")
-        console.print("❌ Failed to reset tasks", style="red")
+        _get_console().print("❌ Failed to reset tasks", style="red")
 
 def main():
     """Entry point for the CLI."""
@@ -1,38 +1,64 @@
 """Logging configuration for TaskListAI."""
 
 import logging
+import logging.handlers
 import os
-from pathlib import Path
 
-# Create logs directory in user's home
+# Logs directory in user's home; created on first record, not at import.
 LOGS_DIR = os.path.expanduser("~/.tasklistai/logs")
-os.makedirs(LOGS_DIR, exist_ok=True)
 
-# Configure logging
-def setup_logger():
-    """Configure the logger for TaskListAI."""
-    logger = logging.getLogger("tasklistai")
-    logger.setLevel(logging.INFO)
+# Number of records buffered in memory before flushing to the log file.
+_BUFFER_CAPACITY = 16
 
-    # Create handlers
-    console_handler = logging.StreamHandler()
-    file_handler = logging.FileHandler(
-        os.path.join(LOGS_DIR, "tasklistai.log"),
-        encoding='utf-8'
-    )
+_configured = False
+
+def _ensure_handlers():
+    """Attach the real handlers the first time a record is emitted.
+
+    Keeps the directory creation and file open off the import path so
+    invocations that never log (e.g. --help) pay no setup cost.
+    """
+    global _configured
+    if _configured:
+        return
 
-    # Create formatters and add it to handlers
     log_format = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    console_handler.setFormatter(log_format)
-    file_handler.setFormatter(log_format)
 
-    # Add handlers to the logger
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(log_format)
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
 
-    return logger
+    try:
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        file_handler = logging.FileHandler(
+            os.path.join(LOGS_DIR, "tasklistai.log"),
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(log_format)
+        # Batch file writes instead of flushing every record; the buffer is
+        # flushed on error, when full, and at interpreter shutdown.
+        logger.addHandler(
+            logging.handlers.MemoryHandler(_BUFFER_CAPACITY, target=file_handler)
+        )
+    except OSError:
+        # Unwritable log directory or file: keep console-only logging
+        # rather than letting setup errors escape from the logging call
+        # that happened to emit the first record.
+        pass
+
+    # Only mark configured once handlers are attached; console at minimum.
+    _configured = True
+
+class _LazySetup(logging.Filter):
+    """Filter that triggers handler setup on the first record."""
+
+    def filter(self, record):
+        _ensure_handlers()
+        return True
 
-# Create and configure logger
-logger = setup_logger() 
\ No newline at end of file
+logger = logging.getLogger("tasklistai")
+logger.setLevel(logging.INFO)
+logger.addFilter(_LazySetup())
+logger.addHandler(logging.NullHandler())
@@ -14,7 +14,9 @@ class TaskStatus(Enum):
 
 class Task:
     """A task in the system."""
-    
+
+    __slots__ = ('id', 'title', 'status', 'created_at', 'completed_at')
+
     def __init__(
         self,
         id: int,
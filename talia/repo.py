@@ -1,59 +1,236 @@
 """Repository module for managing task state."""
 
-from typing import List, Optional
-from .models import Task
-from .storage import load_tasks, save_tasks
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from .models import Task, TaskStatus
+from .storage import load_tasks, compact_tasks, append_ops, add_op, update_op
+
+# Compact the journal back into the snapshot once it outgrows this size.
+COMPACT_LOG_BYTES = 64 * 1024
+
+# Number of tasks kept in the bounded "recent" view for the dashboard.
+RECENT_MAXLEN = 5
 
 class TaskRepo:
-    """Repository for managing task state."""
-    
+    """Repository for managing task state.
+
+    Mutations are queued in memory and written to the journal in a single
+    batch by flush(), so one CLI invocation pays for at most one write.
+    Can be used as a context manager to flush automatically on exit.
+    """
+
     def __init__(self, path: str):
         """Initialize the repository with a storage path.
-        
+
         Args:
             path: Path to the storage file
         """
         self._path = path
-        self._tasks = load_tasks(path)
-    
+        self._tasks: Optional[List[Task]] = None  # loaded lazily on first access
+        self._dirty = False
+        self._pending_ops: List[Dict[str, Any]] = []
+
+    def _ensure_loaded(self):
+        """Load tasks from storage and build the derived indices.
+
+        Deferred until the first access so commands that never read the
+        task list (e.g. reset) skip deserialization entirely.
+        """
+        if self._tasks is not None:
+            return
+        self._tasks = load_tasks(self._path)
+        self._next_id = max((t.id for t in self._tasks), default=0) + 1
+        self._status_counts = Counter(t.status for t in self._tasks)
+        self._by_id = {t.id: t for t in self._tasks}
+        self._by_status: Dict[TaskStatus, set] = {s: set() for s in TaskStatus}
+        for task in self._tasks:
+            self._by_status[task.status].add(task.id)
+        self._recent = deque(self._tasks[-RECENT_MAXLEN:], maxlen=RECENT_MAXLEN)
+
+    def __enter__(self) -> "TaskRepo":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
     @property
     def all(self) -> List[Task]:
         """Get all tasks.
-        
+
         Returns:
             List of all tasks
         """
+        self._ensure_loaded()
         return self._tasks
-    
+
     def save(self):
-        """Save all tasks to storage."""
-        save_tasks(self._tasks, self._path)
-    
+        """Save a full snapshot of all tasks and truncate the journal."""
+        self._ensure_loaded()
+        compact_tasks(self._tasks, self._path)
+        self._pending_ops = []
+        self._dirty = False
+
+    def flush(self):
+        """Write any queued operations to the journal in one batch.
+
+        Compacts the journal into the snapshot once it grows past
+        COMPACT_LOG_BYTES.
+        """
+        if not self._dirty:
+            return
+        size = append_ops(self._pending_ops, self._path)
+        self._pending_ops = []
+        self._dirty = False
+        if size > COMPACT_LOG_BYTES:
+            self.save()
+
+    def append_op(self, op: Dict[str, Any]):
+        """Queue a single operation for the next flush.
+
+        Args:
+            op: Operation record to queue
+        """
+        self._pending_ops.append(op)
+        self._dirty = True
+
     def get(self, task_id: int) -> Optional[Task]:
         """Get a task by ID.
-        
+
         Args:
             task_id: ID of the task to get
-            
+
         Returns:
             Task if found, None otherwise
         """
-        return next((t for t in self._tasks if t.id == task_id), None)
-    
+        self._ensure_loaded()
+        return self._by_id.get(task_id)
+
+    def iter_by_status(self, status: TaskStatus):
+        """Iterate over the tasks with a given status, in id order.
+
+        Args:
+            status: Status to filter by
+
+        Returns:
+            Iterator of matching tasks
+        """
+        self._ensure_loaded()
+        return (self._by_id[i] for i in sorted(self._by_status[status]))
+
     def add(self, task: Task):
         """Add a new task.
-        
+
         Args:
             task: Task to add
         """
+        self._ensure_loaded()
         self._tasks.append(task)
-    
+        if task.id >= self._next_id:
+            self._next_id = task.id + 1
+        self._status_counts[task.status] += 1
+        self._by_id[task.id] = task
+        self._by_status[task.status].add(task.id)
+        self._recent.append(task)
+        self.append_op(add_op(task))
+
+    def set_status(self, task: Task, status: TaskStatus):
+        """Transition a task to a new status, keeping cached counters in sync.
+
+        Args:
+            task: Task to transition
+            status: New status for the task
+        """
+        self._status_counts[task.status] -= 1
+        self._status_counts[status] += 1
+        self._by_status[task.status].discard(task.id)
+        self._by_status[status].add(task.id)
+        task.status = status
+
+    def complete(self, task: Task):
+        """Mark a task as completed.
+
+        Args:
+            task: Task to complete
+        """
+        self.set_status(task, TaskStatus.COMPLETED)
+        task.completed_at = datetime.now()
+        self.append_op(update_op(task))
+
+    def archive(self, task: Task):
+        """Archive a task.
+
+        Args:
+            task: Task to archive
+        """
+        self.set_status(task, TaskStatus.ARCHIVED)
+        self.append_op(update_op(task))
+
+    def move_to_todo(self, task: Task):
+        """Move a task to the To Do list.
+
+        Args:
+            task: Task to move
+        """
+        self.set_status(task, TaskStatus.TODO)
+        self.append_op(update_op(task))
+
+    def move_to_review(self, task: Task):
+        """Move a task to the Review list.
+
+        Args:
+            task: Task to move
+        """
+        self.set_status(task, TaskStatus.REVIEW)
+        self.append_op(update_op(task))
+
+    def recent(self) -> List[Task]:
+        """Get the most recently created tasks, newest first.
+
+        Returns:
+            Up to RECENT_MAXLEN tasks in reverse creation order
+        """
+        self._ensure_loaded()
+        return [*reversed(self._recent)]
+
+    @property
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Get the number of tasks per status, for every status, in one call.
+
+        Returns:
+            Mapping of each status to its task count
+        """
+        self._ensure_loaded()
+        return {s: self._status_counts[s] for s in TaskStatus}
+
+    def count(self, status: TaskStatus) -> int:
+        """Get the number of tasks with a given status.
+
+        Args:
+            status: Status to count
+
+        Returns:
+            Number of tasks with that status
+        """
+        self._ensure_loaded()
+        return self._status_counts[status]
+
+    def clear(self):
+        """Drop all tasks and reset cached state."""
+        self._tasks = []
+        self._next_id = 1
+        self._status_counts = Counter()
+        self._by_id = {}
+        self._by_status = {s: set() for s in TaskStatus}
+        self._recent = deque(maxlen=RECENT_MAXLEN)
+        self._pending_ops = []
+        self._dirty = False
+
     def get_next_id(self) -> int:
         """Get the next available task ID.
-        
+
         Returns:
             Next available task ID
         """
-        if not self._tasks:
-            return 1
-        return max(task.id for task in self._tasks) + 1 
\ No newline at end of file
+        self._ensure_loaded()
+        return self._next_id
@@ -6,6 +6,11 @@ from datetime import datetime
 import shutil
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .models import Task, TaskStatus
 from .logger import logger
 
@@ -13,6 +18,19 @@ from .logger import logger
 STORAGE_DIR = os.path.expanduser("~/.tasklistai")
 STORAGE_FILE = os.path.join(STORAGE_DIR, "tasks.json")
 
+# Value-to-member lookup table; skips Enum's value resolution per record.
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+
+# On-disk format version. v1 files were a bare list with ISO-8601 date
+# strings; v2 wraps the list and stores epoch seconds, which are cheaper
+# to write and parse. v1 files are still readable and are migrated to v2
+# on the next save.
+STORAGE_VERSION = 2
+
+def log_path(path: str) -> str:
+    """Return the path of the operation journal kept alongside a snapshot file."""
+    return os.path.splitext(path)[0] + ".log"
+
 def ensure_storage_dir(path: str):
     """Ensure the storage directory exists."""
     try:
@@ -30,17 +48,39 @@ def task_to_dict(task: Task) -> Dict[str, Any]:
         "id": task.id,
         "title": task.title,
         "status": task.status.value,
-        "created_at": task.created_at.isoformat()
+        "created_at": int(task.created_at.timestamp())
+    }
+
+def add_op(task: Task) -> Dict[str, Any]:
+    """Build a journal operation recording a newly added task."""
+    return {"op": "add", "task": task_to_dict(task)}
+
+def update_op(task: Task) -> Dict[str, Any]:
+    """Build a journal operation recording a status change on a task."""
+    return {
+        "op": "update",
+        "id": task.id,
+        "status": task.status.value,
+        "completed_at": int(task.completed_at.timestamp()) if task.completed_at else None
     }
 
 def dict_to_task(data: Dict[str, Any]) -> Task:
     """Convert a dictionary to a Task object."""
     try:
+        status = _STATUS_BY_VALUE.get(data["status"])
+        if status is None:
+            raise ValueError(f"{data['status']!r} is not a valid TaskStatus")
+        created_at = data["created_at"]
         return Task(
             id=data["id"],
             title=data["title"],
-            status=TaskStatus(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"])
+            status=status,
+            # v1 records carry ISO-8601 strings, v2 epoch seconds.
+            created_at=(
+                datetime.fromisoformat(created_at)
+                if isinstance(created_at, str)
+                else datetime.fromtimestamp(created_at)
+            )
         )
     except KeyError as e:
         logger.error(f"Missing required field in task data: {e}")
@@ -50,12 +90,18 @@ def dict_to_task(data: Dict[str, Any]) -> Task:
         raise
 
 def save_tasks(tasks: List[Task], path: str = STORAGE_FILE):
-    """Save tasks to storage."""
+    """Save a full snapshot of the tasks to storage."""
     try:
         ensure_storage_dir(path)
-        data = [task_to_dict(task) for task in tasks]
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        data = {"v": STORAGE_VERSION, "tasks": [task_to_dict(task) for task in tasks]}
+        tmp = path + ".tmp"
+        if orjson is not None:
+            with open(tmp, "wb", buffering=128 * 1024) as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(tmp, "w", buffering=128 * 1024) as f:
+                json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
         logger.debug(f"Saved {len(tasks)} tasks to storage")
     except PermissionError as e:
         logger.error(f"Permission denied when saving tasks: {e}")
@@ -63,28 +109,115 @@ def save_tasks(tasks: List[Task], path: str = STORAGE_FILE):
     except OSError as e:
         logger.error(f"Failed to save tasks: {e}")
         raise
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, TypeError) as e:
         logger.error(f"Failed to encode tasks to JSON: {e}")
         raise
 
+def append_ops(ops: List[Dict[str, Any]], path: str = STORAGE_FILE) -> int:
+    """Append a batch of operation records to the journal in one write.
+
+    Args:
+        ops: Operation records to append (see add_op/update_op).
+        path: Path to the snapshot file the journal belongs to.
+
+    Returns:
+        Size of the journal in bytes after the write.
+    """
+    try:
+        ensure_storage_dir(path)
+        with open(log_path(path), "a") as f:
+            f.write("".join(json.dumps(op) + "\n" for op in ops))
+            return f.tell()
+    except PermissionError as e:
+        logger.error(f"Permission denied when writing to journal: {e}")
+        raise
+    except OSError as e:
+        logger.error(f"Failed to write to journal: {e}")
+        raise
+
+def compact_tasks(tasks: List[Task], path: str = STORAGE_FILE):
+    """Write a full snapshot and truncate the journal."""
+    save_tasks(tasks, path)
+    try:
+        os.remove(log_path(path))
+    except FileNotFoundError:
+        pass
+
+def _replay_log(tasks: List[Task], path: str) -> List[Task]:
+    """Apply journaled operations on top of a snapshot."""
+    by_id = {task.id: task for task in tasks}
+    try:
+        with open(log_path(path), "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = json.loads(line)
+                    if op["op"] == "add":
+                        task = dict_to_task(op["task"])
+                        if task.id in by_id:
+                            # Already in the snapshot: an interrupted
+                            # compaction left the journal behind. Skip so
+                            # replay stays idempotent.
+                            continue
+                        tasks.append(task)
+                        by_id[task.id] = task
+                    elif op["op"] == "update":
+                        task = by_id.get(op["id"])
+                        if task:
+                            task.status = _STATUS_BY_VALUE[op["status"]]
+                            completed_at = op.get("completed_at")
+                            if completed_at is not None:
+                                task.completed_at = (
+                                    datetime.fromisoformat(completed_at)
+                                    if isinstance(completed_at, str)
+                                    else datetime.fromtimestamp(completed_at)
+                                )
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    logger.warning(f"Skipping malformed journal entry: {e}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Failed to read journal: {e}")
+    return tasks
+
 def load_tasks(path: str = STORAGE_FILE) -> List[Task]:
-    """Load tasks from storage."""
-    if not os.path.exists(path):
-        logger.debug("No storage file found, returning empty list")
-        return []
-    
+    """Load tasks from storage, replaying any journaled operations."""
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        tasks = [dict_to_task(task_data) for task_data in data]
+        # Read the whole file in one call and decode from bytes; orjson's
+        # C-backed parser is preferred, with stdlib json as the fallback.
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, dict):
+            records = data["tasks"]
+            from_date = datetime.fromtimestamp
+        else:
+            # v1 file: bare list with ISO-8601 dates; migrated on next save.
+            records = data
+            from_date = datetime.fromisoformat
+        # Bind the hot names to locals so the per-record loop skips repeated
+        # global and attribute lookups on large task files.
+        by_value = _STATUS_BY_VALUE
+        make_task = Task
+        tasks = [
+            make_task(
+                id=d["id"],
+                title=d["title"],
+                status=by_value[d["status"]],
+                created_at=from_date(d["created_at"])
+            )
+            for d in records
+        ]
         logger.debug(f"Loaded {len(tasks)} tasks from storage")
-        return tasks
+        return _replay_log(tasks, path)
     except json.JSONDecodeError as e:
         logger.error(f"Failed to decode JSON from task file: {e}")
         return []
     except FileNotFoundError:
-        logger.warning("No task file found, returning empty task list")
-        return []
+        logger.debug("No storage file found, replaying journal only")
+        return _replay_log([], path)
     except KeyError as e:
         logger.error(f"Missing key in task data: {e}")
         return []
@@ -108,10 +241,6 @@ def backup_tasks(name: Optional[str] = None, path: str = STORAGE_FILE) -> str:
     Returns:
         Path to the backup file.
     """
-    if not os.path.exists(path):
-        logger.warning("No storage file found to backup")
-        return ""
-    
     try:
         if name:
             backup_file = f"{path}.{name}"
@@ -119,9 +248,20 @@ def backup_tasks(name: Optional[str] = None, path: str = STORAGE_FILE) -> str:
             timestamp = datetime.now().strftime("%Y%m%d%H%M")
             backup_file = f"{path}.{timestamp}"
         
-        shutil.copy2(path, backup_file)
+        try:
+            # A hardlink is an O(1) metadata op; saves publish new snapshots
+            # via os.replace, so the linked inode is never mutated afterwards.
+            os.link(path, backup_file)
+        except OSError:
+            # Cross-device, unsupported filesystem, or backup already exists.
+            # copyfile skips the metadata pass and uses the fast-copy path
+            # (sendfile on Linux); the backup only needs the data.
+            shutil.copyfile(path, backup_file)
         logger.info(f"Created backup at: {backup_file}")
         return backup_file
+    except FileNotFoundError:
+        logger.warning("No storage file found to backup")
+        return ""
     except PermissionError as e:
         logger.error(f"Permission denied when creating backup: {e}")
         return ""
@@ -138,14 +278,13 @@ def remove_storage_file(path: str = STORAGE_FILE) -> bool:
     Returns:
         True if the file was removed, False if it didn't exist.
     """
-    if not os.path.exists(path):
-        logger.warning("No storage file found to remove")
-        return False
-    
     try:
         os.remove(path)
         logger.info(f"Removed storage file: {path}")
         return True
+    except FileNotFoundError:
+        logger.warning("No storage file found to remove")
+        return False
     except PermissionError as e:
         logger.error(f"Permission denied when removing storage file: {e}")
         return False
@@ -0,0 +1,255 @@
+"""SQLite-backed storage for TaskListAI.
+
+Alternative to the JSON snapshot/journal storage: tasks live in a single
+indexed table, so lookups are O(log N), status filters touch only the
+matching rows, and every statement is durable and atomic on its own.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from .models import Task, TaskStatus
+from .logger import logger
+from .storage import STORAGE_DIR, load_tasks, save_tasks
+
+# Database file path
+DB_FILE = os.path.join(STORAGE_DIR, "tasks.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+"""
+
+# Stable small-int code per status for compact, indexable storage.
+_STATUS_CODE = {s: i for i, s in enumerate(TaskStatus)}
+_STATUS_FROM_CODE = {i: s for s, i in _STATUS_CODE.items()}
+
+def _row_to_task(row) -> Task:
+    """Convert a tasks-table row to a Task object."""
+    return Task(
+        id=row[0],
+        title=row[1],
+        status=_STATUS_FROM_CODE[row[2]],
+        created_at=datetime.fromtimestamp(row[3]),
+        completed_at=datetime.fromtimestamp(row[4]) if row[4] is not None else None
+    )
+
+class SqliteTaskRepo:
+    """Repository for managing task state in an SQLite database.
+
+    Exposes the same interface as TaskRepo so the CLI commands can run
+    against either backend. Can be used as a context manager to close
+    the connection on exit.
+    """
+
+    def __init__(self, path: str = DB_FILE):
+        """Initialize the repository with a database path.
+
+        Args:
+            path: Path to the database file
+        """
+        self._path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        # WAL keeps readers from blocking while another process writes.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SqliteTaskRepo":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    @property
+    def all(self) -> List[Task]:
+        """Get all tasks, in id order.
+
+        Returns:
+            List of all tasks
+        """
+        rows = self._conn.execute("SELECT * FROM tasks ORDER BY id").fetchall()
+        return [_row_to_task(row) for row in rows]
+
+    def save(self):
+        """No-op for interface parity: every statement commits on its own."""
+
+    def flush(self):
+        """No-op for interface parity: every statement commits on its own."""
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Get a task by ID.
+
+        Args:
+            task_id: ID of the task to get
+
+        Returns:
+            Task if found, None otherwise
+        """
+        row = self._conn.execute(
+            "SELECT * FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        return _row_to_task(row) if row else None
+
+    def iter_by_status(self, status: TaskStatus) -> Iterator[Task]:
+        """Iterate over the tasks with a given status, in id order.
+
+        Args:
+            status: Status to filter by
+
+        Returns:
+            Iterator of matching tasks
+        """
+        rows = self._conn.execute(
+            "SELECT * FROM tasks WHERE status = ? ORDER BY id",
+            (_STATUS_CODE[status],)
+        )
+        return (_row_to_task(row) for row in rows)
+
+    def add(self, task: Task):
+        """Add a new task.
+
+        Args:
+            task: Task to add
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO tasks VALUES (?, ?, ?, ?, ?)",
+                (
+                    task.id,
+                    task.title,
+                    _STATUS_CODE[task.status],
+                    task.created_at.timestamp(),
+                    task.completed_at.timestamp() if task.completed_at else None
+                )
+            )
+
+    def set_status(self, task: Task, status: TaskStatus):
+        """Transition a task to a new status.
+
+        Args:
+            task: Task to transition
+            status: New status for the task
+        """
+        task.status = status
+        with self._conn:
+            self._conn.execute(
+                "UPDATE tasks SET status = ?, completed_at = ? WHERE id = ?",
+                (
+                    _STATUS_CODE[status],
+                    task.completed_at.timestamp() if task.completed_at else None,
+                    task.id
+                )
+            )
+
+    def complete(self, task: Task):
+        """Mark a task as completed.
+
+        Args:
+            task: Task to complete
+        """
+        task.completed_at = datetime.now()
+        self.set_status(task, TaskStatus.COMPLETED)
+
+    def archive(self, task: Task):
+        """Archive a task.
+
+        Args:
+            task: Task to archive
+        """
+        self.set_status(task, TaskStatus.ARCHIVED)
+
+    def move_to_todo(self, task: Task):
+        """Move a task to the To Do list.
+
+        Args:
+            task: Task to move
+        """
+        self.set_status(task, TaskStatus.TODO)
+
+    def move_to_review(self, task: Task):
+        """Move a task to the Review list.
+
+        Args:
+            task: Task to move
+        """
+        self.set_status(task, TaskStatus.REVIEW)
+
+    @property
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Get the number of tasks per status, for every status, in one call.
+
+        Returns:
+            Mapping of each status to its task count
+        """
+        counts = {s: 0 for s in TaskStatus}
+        rows = self._conn.execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        )
+        for code, count in rows:
+            counts[_STATUS_FROM_CODE[code]] = count
+        return counts
+
+    def count(self, status: TaskStatus) -> int:
+        """Get the number of tasks with a given status.
+
+        Args:
+            status: Status to count
+
+        Returns:
+            Number of tasks with that status
+        """
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = ?",
+            (_STATUS_CODE[status],)
+        ).fetchone()
+        return row[0]
+
+    def clear(self):
+        """Drop all tasks."""
+        with self._conn:
+            self._conn.execute("DELETE FROM tasks")
+
+    def get_next_id(self) -> int:
+        """Get the next available task ID.
+
+        Returns:
+            Next available task ID
+        """
+        row = self._conn.execute("SELECT MAX(id) FROM tasks").fetchone()
+        return (row[0] or 0) + 1
+
+    def import_json(self, path: str) -> int:
+        """Import tasks from a JSON storage file.
+
+        Args:
+            path: Path to the JSON storage file
+
+        Returns:
+            Number of tasks imported
+        """
+        tasks = load_tasks(path)
+        for task in tasks:
+            self.add(task)
+        logger.info(f"Imported {len(tasks)} tasks from {path}")
+        return len(tasks)
+
+    def export_json(self, path: str):
+        """Export all tasks to a JSON storage file.
+
+        Args:
+            path: Path to the JSON storage file
+        """
+        save_tasks(self.all, path)
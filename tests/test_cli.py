@@ -3,6 +3,7 @@
 import pytest
 from click.testing import CliRunner
 from datetime import datetime
+from unittest.mock import Mock
 import os
 from talia.cli import cli
 from talia.models import Task, TaskStatus
@@ -24,6 +25,24 @@ def test_add_command(runner, temp_storage):
     assert result.exit_code == 0
     assert "Added to inbox: Test task" in result.output
 
+def test_add_command_flush_error(runner, temp_storage, monkeypatch):
+    """Test that a failing journal write is reported, not raised."""
+    monkeypatch.setattr(
+        "talia.repo.append_ops",
+        Mock(side_effect=PermissionError("Mock PermissionError"))
+    )
+    result = runner.invoke(cli, ['add', 'Test task'], obj=TaskRepo(str(temp_storage)))
+    assert result.exit_code == 0
+    assert "❌ Failed to save tasks" in result.output
+
+def test_add_batch_command(runner, temp_storage):
+    """Test the add-batch command reading titles from stdin."""
+    repo = TaskRepo(str(temp_storage))
+    result = runner.invoke(cli, ['add-batch'], input="Task 1\n\nTask 2\n", obj=repo)
+    assert result.exit_code == 0
+    assert "✅ Added 2 tasks to inbox" in result.output
+    assert [task.title for task in repo.all] == ["Task 1", "Task 2"]
+
 def test_list_command_empty(runner, temp_storage):
     """Test the list command with no tasks."""
     result = runner.invoke(cli, ['list'], obj=TaskRepo(str(temp_storage)))
@@ -133,6 +152,24 @@ def test_dashboard_command_with_tasks(runner, temp_storage):
     assert "✅ Completed:  1" in result.output
     assert "⏳ Pending:    1" in result.output
 
+def test_backup_command(runner, temp_storage):
+    """Test the backup command."""
+    repo = TaskRepo(str(temp_storage))
+    task = Task(id=1, title="Task 1", status=TaskStatus.INBOX, created_at=datetime.now())
+    repo.add(task)
+    repo.save()
+
+    result = runner.invoke(cli, ['backup', '--name', 'mybackup'], obj=repo)
+    assert result.exit_code == 0
+    assert "📦 Tasks backed up to:" in result.output
+    assert (temp_storage.parent / "tasks.json.mybackup").exists()
+
+def test_backup_command_no_tasks(runner, temp_storage):
+    """Test the backup command with no tasks."""
+    result = runner.invoke(cli, ['backup'], obj=TaskRepo(str(temp_storage)))
+    assert result.exit_code == 0
+    assert "No tasks found to backup" in result.output
+
 def test_reset_command(runner, temp_storage):
     """Test the reset command."""
     repo = TaskRepo(str(temp_storage))
@@ -146,4 +183,16 @@ def test_reset_command(runner, temp_storage):
     
     # Create a new repo instance to verify tasks were cleared
     new_repo = TaskRepo(str(temp_storage))
-    assert len(new_repo.all) == 0 
\ No newline at end of file
+    assert len(new_repo.all) == 0
+
+def test_reset_command_corrupt_file(runner, temp_storage):
+    """Test that reset backs up an unparseable tasks file before replacing it."""
+    temp_storage.write_text("invalid json")
+
+    result = runner.invoke(cli, ['reset'], obj=TaskRepo(str(temp_storage)))
+    assert result.exit_code == 0
+    assert "📦 Tasks backed up to:" in result.output
+
+    # The raw bytes survived in the backup
+    backup_file = temp_storage.parent / "tasks.json.todelete"
+    assert backup_file.read_text() == "invalid json" 
\ No newline at end of file
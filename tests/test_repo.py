@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 import os
 from talia.repo import TaskRepo
+from talia.storage import log_path
 from talia.models import Task, TaskStatus
 
 @pytest.fixture
@@ -71,4 +72,45 @@ def test_repo_save_and_load(temp_storage):
     assert repo2.get(1).title == "Task 1"
     assert repo2.get(2).title == "Task 2"
     assert repo2.get(1).status == TaskStatus.INBOX
-    assert repo2.get(2).status == TaskStatus.TODO 
\ No newline at end of file
+    assert repo2.get(2).status == TaskStatus.TODO
+
+def test_repo_flush_replays_adds(temp_storage, sample_task):
+    """Test that a flushed add is replayed from the journal by a fresh repo."""
+    repo1 = TaskRepo(str(temp_storage))
+    repo1.add(sample_task)
+    repo1.flush()
+
+    # The add went to the journal, not the snapshot
+    assert os.path.exists(log_path(str(temp_storage)))
+    assert not os.path.exists(temp_storage)
+
+    repo2 = TaskRepo(str(temp_storage))
+    assert len(repo2.all) == 1
+    assert repo2.get(1).title == sample_task.title
+    assert repo2.get(1).status == TaskStatus.INBOX
+
+def test_repo_flush_replays_updates(temp_storage, sample_task):
+    """Test that a flushed status change is replayed on top of the snapshot."""
+    repo1 = TaskRepo(str(temp_storage))
+    repo1.add(sample_task)
+    repo1.save()
+
+    repo1.complete(sample_task)
+    repo1.flush()
+
+    repo2 = TaskRepo(str(temp_storage))
+    assert repo2.get(1).status == TaskStatus.COMPLETED
+    assert repo2.get(1).completed_at is not None
+
+def test_repo_flush_compacts_large_journal(temp_storage, monkeypatch):
+    """Test that flush folds an oversized journal back into the snapshot."""
+    monkeypatch.setattr("talia.repo.COMPACT_LOG_BYTES", 64)
+    repo1 = TaskRepo(str(temp_storage))
+    for i in range(1, 6):
+        repo1.add(Task(id=i, title=f"Task {i}", status=TaskStatus.INBOX, created_at=datetime.now()))
+    repo1.flush()
+
+    # The journal outgrew the threshold, so it was compacted away
+    assert not os.path.exists(log_path(str(temp_storage)))
+    assert os.path.exists(temp_storage)
+    assert len(TaskRepo(str(temp_storage)).all) == 5 
\ No newline at end of file
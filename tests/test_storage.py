@@ -1,10 +1,13 @@
 """Tests for the storage module."""
 
+import io
 import os
+import sys
 import json
 import pytest
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock
 from talia.storage import (
     ensure_storage_dir,
     task_to_dict,
@@ -13,22 +16,78 @@ from talia.storage import (
     load_tasks,
     backup_tasks,
     remove_storage_file,
+    log_path,
+    add_op,
     STORAGE_DIR,
     STORAGE_FILE
 )
 from talia.models import Task, TaskStatus
-import shutil
+from talia import storage
+
+@pytest.fixture(scope="module")
+def storage_root(tmp_path_factory):
+    """Create one shared storage directory for the whole module.
+
+    Avoids the per-test mkdir/cleanup that the function-scoped tmp_path
+    fixture performs; tests that mutate directory permissions keep using
+    tmp_path instead.
+    """
+    return tmp_path_factory.mktemp("talia_storage")
 
 @pytest.fixture
-def temp_storage(tmp_path):
-    """Create a temporary storage directory."""
-    storage_dir = tmp_path / ".tasklistai"
-    storage_file = storage_dir / "tasks.json"
-    return storage_file
+def temp_storage(request, storage_root):
+    """Return a per-test storage file path inside the shared directory."""
+    return storage_root / f"{request.node.name}.json"
 
 @pytest.fixture
+def mem_fs(monkeypatch):
+    """Serve file reads from an in-memory store instead of the real FS.
+
+    Maps path -> bytes; opening any path not in the store raises
+    FileNotFoundError, so load tests run without touching disk. Patched
+    at the storage-module level so unrelated callers of the builtin
+    (e.g. the lazy log file handler) are untouched.
+    """
+    files = {}
+
+    def fake_open(path, mode="r", *args, **kwargs):
+        key = os.fspath(path)
+        if key not in files:
+            raise FileNotFoundError(2, "No such file or directory", key)
+        data = files[key]
+        return io.BytesIO(data) if "b" in mode else io.StringIO(data.decode())
+
+    monkeypatch.setattr("talia.storage.open", fake_open, raising=False)
+    return files
+
+@pytest.fixture
+def readonly_dir(tmp_path):
+    """Create a read-only subdirectory holding one file.
+
+    Restored to writable on teardown so the pytest tmp tree itself is
+    never left in a read-only state.
+    """
+    d = tmp_path / "ro"
+    d.mkdir()
+    (d / "file.json").touch()
+    os.chmod(d, 0o555)
+    yield d
+    os.chmod(d, 0o755)
+
+@pytest.fixture
+def broken_open(request, monkeypatch):
+    """Patch the storage module's open to raise the exception supplied via indirect parametrization."""
+    exc = request.param
+    monkeypatch.setattr("talia.storage.open", Mock(side_effect=exc), raising=False)
+    return exc
+
+@pytest.fixture(scope="session")
 def sample_task():
-    """Create a sample task for testing."""
+    """Create a sample task for testing.
+
+    Session-scoped: the task is only ever read by the tests that use it,
+    so one instance can be shared across the whole run.
+    """
     return Task(
         id=1,
         title="Test task",
@@ -36,43 +95,52 @@ def sample_task():
         created_at=datetime.now()
     )
 
-def test_ensure_storage_dir(temp_storage):
+@pytest.fixture(scope="session")
+def sample_task_dict(sample_task):
+    """Serialized form of sample_task, computed once per run."""
+    return task_to_dict(sample_task)
+
+def test_ensure_storage_dir(tmp_path):
     """Test creating storage directory."""
-    ensure_storage_dir(str(temp_storage))
-    assert os.path.exists(os.path.dirname(temp_storage))
+    storage_file = tmp_path / ".tasklistai" / "tasks.json"
+    ensure_storage_dir(str(storage_file))
+    assert os.path.exists(os.path.dirname(storage_file))
 
-def test_ensure_storage_dir_permission_error(tmp_path):
+def test_ensure_storage_dir_permission_error(tmp_path, monkeypatch):
     """Test storage directory creation with permission error."""
-    # Create a directory that we can't write to
-    os.chmod(tmp_path, 0o444)  # Read-only
+    monkeypatch.setattr(os, 'makedirs', Mock(side_effect=PermissionError("Mock PermissionError")))
     with pytest.raises(PermissionError):
         ensure_storage_dir(str(tmp_path / "test" / "file.txt"))
 
+@pytest.mark.skipif(
+    sys.platform == "win32" or os.geteuid() == 0,
+    reason="filesystem permission bits are not enforced for root or on Windows"
+)
+def test_ensure_storage_dir_readonly_fs(readonly_dir):
+    """Integration canary: a genuinely read-only directory rejects creation."""
+    with pytest.raises(PermissionError):
+        ensure_storage_dir(str(readonly_dir / "test" / "file.txt"))
+
 def test_ensure_storage_dir_os_error(tmp_path, monkeypatch):
     """Test storage directory creation with OSError."""
-    def mock_makedirs(*args, **kwargs):
-        raise OSError("Mock OSError")
-    
-    monkeypatch.setattr(os, 'makedirs', mock_makedirs)
+    monkeypatch.setattr(os, 'makedirs', Mock(side_effect=OSError("Mock OSError")))
     with pytest.raises(OSError):
         ensure_storage_dir(str(tmp_path / "test" / "file.txt"))
 
-def test_task_to_dict(sample_task):
+def test_task_to_dict(sample_task, sample_task_dict):
     """Test converting task to dictionary."""
-    task_dict = task_to_dict(sample_task)
-    assert task_dict["id"] == sample_task.id
-    assert task_dict["title"] == sample_task.title
-    assert task_dict["status"] == sample_task.status.value
-    assert task_dict["created_at"] == sample_task.created_at.isoformat()
+    assert sample_task_dict["id"] == sample_task.id
+    assert sample_task_dict["title"] == sample_task.title
+    assert sample_task_dict["status"] == sample_task.status.value
+    assert sample_task_dict["created_at"] == int(sample_task.created_at.timestamp())
 
-def test_dict_to_task(sample_task):
+def test_dict_to_task(sample_task, sample_task_dict):
     """Test converting dictionary to task."""
-    task_dict = task_to_dict(sample_task)
-    task = dict_to_task(task_dict)
+    task = dict_to_task(sample_task_dict)
     assert task.id == sample_task.id
     assert task.title == sample_task.title
     assert task.status == sample_task.status
-    assert task.created_at.isoformat() == sample_task.created_at.isoformat()
+    assert task.created_at == datetime.fromtimestamp(sample_task_dict["created_at"])
 
 def test_dict_to_task_missing_field():
     """Test converting dictionary with missing field to task."""
@@ -102,96 +170,137 @@ def test_save_and_load_tasks(temp_storage, sample_task):
     assert loaded_tasks[0].title == sample_task.title
     assert loaded_tasks[0].status == sample_task.status
 
-def test_save_tasks_permission_error(tmp_path):
-    """Test saving tasks with permission error."""
-    # Create a directory that we can't write to
-    os.chmod(tmp_path, 0o444)  # Read-only
-    with pytest.raises(PermissionError):
-        save_tasks([Task(id=1, title="Test")], str(tmp_path / "test.json"))
+@pytest.fixture(scope="session")
+def task_batch():
+    """A pool of 5000 tasks, built once and sliced by the bulk tests."""
+    now = datetime.now()
+    return [
+        Task(id=i, title=f"Task {i}", status=TaskStatus.INBOX, created_at=now)
+        for i in range(1, 5001)
+    ]
+
+@pytest.mark.parametrize("n", [1, 100, 5000])
+def test_save_and_load_many_tasks(temp_storage, task_batch, n):
+    """Test that save/load round-trips task lists of varying sizes."""
+    save_tasks(task_batch[:n], str(temp_storage))
+    loaded_tasks = load_tasks(str(temp_storage))
+    assert len(loaded_tasks) == n
+    assert loaded_tasks[0].id == 1
+    assert loaded_tasks[-1].id == n
+
+def test_load_tasks_v1_format(temp_storage, sample_task, mem_fs):
+    """Test loading a v1 file (bare list with ISO-8601 dates)."""
+    mem_fs[str(temp_storage)] = json.dumps([{
+        "id": sample_task.id,
+        "title": sample_task.title,
+        "status": sample_task.status.value,
+        "created_at": sample_task.created_at.isoformat()
+    }]).encode()
 
-def test_save_tasks_json_error(temp_storage, sample_task, monkeypatch):
-    """Test saving tasks with JSON encoding error."""
-    def mock_json_dump(*args, **kwargs):
-        raise json.JSONDecodeError("Mock JSON Error", "", 0)
-    
-    monkeypatch.setattr(json, 'dump', mock_json_dump)
-    with pytest.raises(json.JSONDecodeError):
+    tasks = load_tasks(str(temp_storage))
+    assert len(tasks) == 1
+    assert tasks[0].created_at == sample_task.created_at
+
+@pytest.mark.parametrize("broken_open", [
+    pytest.param(PermissionError("Mock PermissionError"), id="permission_error"),
+    pytest.param(OSError("Mock OSError"), id="os_error"),
+], indirect=True)
+def test_save_tasks_open_error(temp_storage, sample_task, broken_open):
+    """Test that save_tasks propagates injected open errors."""
+    with pytest.raises(type(broken_open)):
         save_tasks([sample_task], str(temp_storage))
 
-def test_save_tasks_os_error(temp_storage, sample_task, monkeypatch):
-    """Test saving tasks with OSError."""
-    def mock_open(*args, **kwargs):
-        raise OSError("Mock OSError")
-    
-    monkeypatch.setattr('builtins.open', mock_open)
-    with pytest.raises(OSError):
+@pytest.mark.parametrize("message", [
+    pytest.param("Mock JSON Error", id="json_error"),
+    pytest.param("Mock JSON Error with message", id="json_error_with_message"),
+])
+def test_save_tasks_encode_error(temp_storage, sample_task, monkeypatch, message):
+    """Test that save_tasks propagates injected encoding errors."""
+    if storage.orjson is not None:
+        error = storage.orjson.JSONEncodeError(message)
+        monkeypatch.setattr(storage.orjson, 'dumps', Mock(side_effect=error))
+    else:
+        error = json.JSONDecodeError(message, "", 0)
+        monkeypatch.setattr(json, 'dump', Mock(side_effect=error))
+
+    with pytest.raises(type(error)):
         save_tasks([sample_task], str(temp_storage))
 
 def test_load_tasks_empty_file(temp_storage):
     """Test loading tasks from empty file."""
-    # Create empty file
-    ensure_storage_dir(str(temp_storage))
-    with open(temp_storage, "w") as f:
-        f.write("[]")
-    
+    temp_storage.parent.mkdir(parents=True, exist_ok=True)
+    temp_storage.write_text("[]")
+
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
 
 def test_load_tasks_invalid_json(temp_storage):
     """Test loading tasks from invalid JSON file."""
-    # Create file with invalid JSON
-    ensure_storage_dir(str(temp_storage))
-    with open(temp_storage, "w") as f:
-        f.write("invalid json")
-    
+    temp_storage.parent.mkdir(parents=True, exist_ok=True)
+    temp_storage.write_text("invalid json")
+
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
 
-def test_load_tasks_file_not_found(temp_storage):
+def test_load_tasks_file_not_found(temp_storage, mem_fs):
     """Test loading tasks when file doesn't exist."""
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
 
-def test_load_tasks_key_error(temp_storage):
+def test_load_tasks_key_error(temp_storage, mem_fs):
     """Test loading tasks with missing key in data."""
-    ensure_storage_dir(str(temp_storage))
-    with open(temp_storage, "w") as f:
-        json.dump([{"id": 1}], f)  # Missing required fields
-    
+    mem_fs[str(temp_storage)] = json.dumps([{"id": 1}]).encode()  # Missing required fields
+
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
 
-def test_load_tasks_value_error(temp_storage):
+def test_load_tasks_value_error(temp_storage, mem_fs):
     """Test loading tasks with invalid value in data."""
-    ensure_storage_dir(str(temp_storage))
-    with open(temp_storage, "w") as f:
-        json.dump([{
-            "id": 1,
-            "title": "Test",
-            "status": "INVALID_STATUS",
-            "created_at": "invalid-date"
-        }], f)
-    
+    mem_fs[str(temp_storage)] = json.dumps([{
+        "id": 1,
+        "title": "Test",
+        "status": "INVALID_STATUS",
+        "created_at": "invalid-date"
+    }]).encode()
+
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
 
-def test_load_tasks_permission_error(temp_storage, monkeypatch):
-    """Test loading tasks with permission error."""
-    def mock_open(*args, **kwargs):
-        raise PermissionError("Mock PermissionError")
-    
-    monkeypatch.setattr('builtins.open', mock_open)
+@pytest.mark.parametrize("broken_open", [
+    pytest.param(PermissionError("Mock PermissionError"), id="permission_error"),
+    pytest.param(OSError("Mock OSError"), id="os_error"),
+], indirect=True)
+def test_load_tasks_open_error(temp_storage, broken_open):
+    """Test that load_tasks returns an empty list on injected open errors."""
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
 
-def test_load_tasks_os_error(temp_storage, monkeypatch):
-    """Test loading tasks with OSError."""
-    def mock_open(*args, **kwargs):
-        raise OSError("Mock OSError")
-    
-    monkeypatch.setattr('builtins.open', mock_open)
+def test_load_tasks_skips_malformed_journal_entries(temp_storage, sample_task):
+    """Test that replay drops malformed journal lines but keeps valid ones."""
+    save_tasks([sample_task], str(temp_storage))
+
+    replayed = Task(id=3, title="Replayed", status=TaskStatus.INBOX, created_at=datetime.now())
+    Path(log_path(str(temp_storage))).write_text(
+        "not json\n"
+        + json.dumps({"op": "add", "task": {"id": 2}}) + "\n"  # missing fields
+        + json.dumps(add_op(replayed)) + "\n"
+    )
+
     tasks = load_tasks(str(temp_storage))
-    assert len(tasks) == 0
+    assert [task.id for task in tasks] == [sample_task.id, 3]
+    assert tasks[1].title == "Replayed"
+
+def test_load_tasks_ignores_stale_journal_adds(temp_storage, sample_task):
+    """Test that adds already present in the snapshot are not replayed twice.
+
+    An interrupted compaction can leave the journal in place next to a
+    snapshot that already contains its tasks.
+    """
+    save_tasks([sample_task], str(temp_storage))
+    Path(log_path(str(temp_storage))).write_text(json.dumps(add_op(sample_task)) + "\n")
+
+    tasks = load_tasks(str(temp_storage))
+    assert [task.id for task in tasks] == [sample_task.id]
 
 def test_backup_tasks(temp_storage, sample_task):
     """Test creating backup of tasks."""
@@ -213,25 +322,25 @@ def test_backup_tasks_no_file(temp_storage):
 
 def test_backup_tasks_permission_error(temp_storage, sample_task, monkeypatch):
     """Test creating backup with permission error."""
+    import shutil
+
     # Save some tasks
     save_tasks([sample_task], str(temp_storage))
-    
-    def mock_copy2(*args, **kwargs):
-        raise PermissionError("Mock PermissionError")
-    
-    monkeypatch.setattr(shutil, 'copy2', mock_copy2)
+
+    monkeypatch.setattr(os, 'link', Mock(side_effect=OSError("Mock cross-device link")))
+    monkeypatch.setattr(shutil, 'copyfile', Mock(side_effect=PermissionError("Mock PermissionError")))
     backup_path = backup_tasks(path=str(temp_storage))
     assert backup_path == ""
 
 def test_backup_tasks_os_error(temp_storage, sample_task, monkeypatch):
     """Test creating backup with OSError."""
+    import shutil
+
     # Save some tasks
     save_tasks([sample_task], str(temp_storage))
-    
-    def mock_copy2(*args, **kwargs):
-        raise OSError("Mock OSError")
-    
-    monkeypatch.setattr(shutil, 'copy2', mock_copy2)
+
+    monkeypatch.setattr(os, 'link', Mock(side_effect=OSError("Mock cross-device link")))
+    monkeypatch.setattr(shutil, 'copyfile', Mock(side_effect=OSError("Mock OSError")))
     backup_path = backup_tasks(path=str(temp_storage))
     assert backup_path == ""
 
@@ -249,54 +358,30 @@ def test_remove_storage_file_no_file(temp_storage):
     """Test removing non-existent storage file."""
     assert not remove_storage_file(str(temp_storage))
 
-def test_remove_storage_file_permission_error(tmp_path):
+def test_remove_storage_file_permission_error(temp_storage, monkeypatch):
     """Test removing storage file with permission error."""
-    # Create a file that we can't remove
-    test_file = tmp_path / "test.json"
-    test_file.touch()
-    os.chmod(tmp_path, 0o444)  # Read-only directory
-    assert not remove_storage_file(str(test_file))
-
-def test_remove_storage_file_os_error(temp_storage, sample_task, monkeypatch):
-    """Test removing storage file with OSError."""
+    monkeypatch.setattr(os, 'remove', Mock(side_effect=PermissionError("Mock PermissionError")))
+    assert not remove_storage_file(str(temp_storage))
+
+@pytest.mark.parametrize("error", [
+    pytest.param(OSError("Mock OSError"), id="os_error"),
+    pytest.param(OSError("Mock OSError with message"), id="os_error_with_message"),
+])
+def test_remove_storage_file_error(temp_storage, sample_task, monkeypatch, error):
+    """Test that remove_storage_file returns False on injected errors."""
     # Create and save some tasks
     save_tasks([sample_task], str(temp_storage))
-    
-    def mock_remove(*args, **kwargs):
-        raise OSError("Mock OSError")
-    
-    monkeypatch.setattr(os, 'remove', mock_remove)
-    assert not remove_storage_file(str(temp_storage))
 
-def test_save_tasks_json_error_with_message(temp_storage, sample_task, monkeypatch):
-    """Test saving tasks with JSON encoding error with message."""
-    def mock_json_dump(*args, **kwargs):
-        raise json.JSONDecodeError("Mock JSON Error", "test", 0)
-    
-    monkeypatch.setattr(json, 'dump', mock_json_dump)
-    with pytest.raises(json.JSONDecodeError):
-        save_tasks([sample_task], str(temp_storage))
+    monkeypatch.setattr(os, 'remove', Mock(side_effect=error))
+    assert not remove_storage_file(str(temp_storage))
 
-def test_load_tasks_json_error_with_message(temp_storage, monkeypatch):
+def test_load_tasks_json_error_with_message(temp_storage, mem_fs, monkeypatch):
     """Test loading tasks with JSON decode error with message."""
-    ensure_storage_dir(str(temp_storage))
-    with open(temp_storage, "w") as f:
-        f.write("invalid json")
-    
-    def mock_json_load(*args, **kwargs):
-        raise json.JSONDecodeError("Mock JSON Error", "test", 0)
-    
-    monkeypatch.setattr(json, 'load', mock_json_load)
+    mem_fs[str(temp_storage)] = b"invalid json"
+
+    if storage.orjson is not None:
+        error = storage.orjson.JSONDecodeError("Mock JSON Error", "test", 0)
+        monkeypatch.setattr(storage.orjson, 'loads', Mock(side_effect=error))
+
     tasks = load_tasks(str(temp_storage))
     assert len(tasks) == 0
-
-def test_remove_storage_file_with_message(temp_storage, sample_task, monkeypatch):
-    """Test removing storage file with error message."""
-    # Create and save some tasks
-    save_tasks([sample_task], str(temp_storage))
-    
-    def mock_remove(*args, **kwargs):
-        raise OSError("Mock OSError with message")
-    
-    monkeypatch.setattr(os, 'remove', mock_remove)
-    assert not remove_storage_file(str(temp_storage)) 
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Unit tests for the SQLite storage backend."""
+
+import pytest
+from datetime import datetime
+from talia.storage_sqlite import SqliteTaskRepo
+from talia.storage import save_tasks
+from talia.models import Task, TaskStatus
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a temporary database path for testing."""
+    return tmp_path / "tasks.db"
+
+@pytest.fixture
+def repo(db_path):
+    """Create a SqliteTaskRepo instance with temporary storage."""
+    with SqliteTaskRepo(str(db_path)) as repo:
+        yield repo
+
+@pytest.fixture
+def sample_task():
+    """Create a sample task for testing."""
+    return Task(
+        id=1,
+        title="Test task",
+        status=TaskStatus.INBOX,
+        created_at=datetime.now()
+    )
+
+def test_repo_initialization(repo):
+    """Test that repo initializes with empty task table."""
+    assert len(repo.all) == 0
+
+def test_repo_add_and_get_task(repo, sample_task):
+    """Test adding a task and getting it by ID."""
+    repo.add(sample_task)
+    task = repo.get(1)
+    assert task.id == sample_task.id
+    assert task.title == sample_task.title
+    assert task.status == sample_task.status
+    assert repo.get(999) is None
+
+def test_repo_get_next_id(repo, sample_task):
+    """Test getting the next available task ID."""
+    assert repo.get_next_id() == 1
+    repo.add(sample_task)
+    assert repo.get_next_id() == 2
+
+def test_repo_status_transitions(repo, sample_task):
+    """Test that status transitions persist."""
+    repo.add(sample_task)
+    repo.complete(sample_task)
+    assert repo.get(1).status == TaskStatus.COMPLETED
+    assert repo.get(1).completed_at is not None
+    repo.archive(sample_task)
+    assert repo.get(1).status == TaskStatus.ARCHIVED
+
+def test_repo_iter_by_status(repo):
+    """Test filtering tasks by status."""
+    repo.add(Task(id=1, title="Task 1", status=TaskStatus.INBOX, created_at=datetime.now()))
+    repo.add(Task(id=2, title="Task 2", status=TaskStatus.TODO, created_at=datetime.now()))
+    todos = list(repo.iter_by_status(TaskStatus.TODO))
+    assert len(todos) == 1
+    assert todos[0].title == "Task 2"
+
+def test_repo_counts(repo):
+    """Test per-status counts."""
+    repo.add(Task(id=1, title="Task 1", status=TaskStatus.INBOX, created_at=datetime.now()))
+    repo.add(Task(id=2, title="Task 2", status=TaskStatus.COMPLETED, created_at=datetime.now()))
+    assert repo.count(TaskStatus.COMPLETED) == 1
+    assert repo.status_counts[TaskStatus.INBOX] == 1
+
+def test_repo_clear(repo, sample_task):
+    """Test dropping all tasks."""
+    repo.add(sample_task)
+    repo.clear()
+    assert len(repo.all) == 0
+
+def test_repo_persistence(db_path, sample_task):
+    """Test that tasks persist across repo instances."""
+    with SqliteTaskRepo(str(db_path)) as repo1:
+        repo1.add(sample_task)
+    with SqliteTaskRepo(str(db_path)) as repo2:
+        assert len(repo2.all) == 1
+        assert repo2.get(1).title == sample_task.title
+
+def test_import_and_export_json(db_path, tmp_path, sample_task):
+    """Test migrating tasks between the JSON and SQLite backends."""
+    json_file = tmp_path / "tasks.json"
+    save_tasks([sample_task], str(json_file))
+
+    with SqliteTaskRepo(str(db_path)) as repo:
+        assert repo.import_json(str(json_file)) == 1
+        assert repo.get(1).title == sample_task.title
+
+        export_file = tmp_path / "export.json"
+        repo.export_json(str(export_file))
+    assert export_file.exists()